@@ -2,6 +2,7 @@ from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from app.config import settings
 from app.database import Base
 from app.models import EventLog
 from alembic import context
@@ -15,6 +16,10 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# Use the same database as the application instead of the ini placeholder.
+if settings.database_url:
+    config.set_main_option("sqlalchemy.url", settings.database_url)
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
@@ -0,0 +1,46 @@
+"""Create event_logs table
+
+Revision ID: 3f9c2d7a1b5e
+Revises: 1b14462a4c7f, a76661996ef3, e0940ed2b686
+Create Date: 2026-10-19 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2d7a1b5e'
+down_revision: Union[str, Sequence[str], None] = ('1b14462a4c7f', 'a76661996ef3', 'e0940ed2b686')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases bootstrapped by the old create_all() on startup already have
+    # the table; only create it on fresh databases.
+    if sa.inspect(op.get_bind()).has_table('event_logs'):
+        return
+    op.create_table(
+        'event_logs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('event_type', sa.String(), nullable=False),
+        sa.Column('event_metadata', sa.JSON(), nullable=True),
+        sa.Column('original_timestamp', sa.DateTime(), nullable=False),
+        sa.Column('processed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_event_logs_id'), 'event_logs', ['id'], unique=False)
+    op.create_index(op.f('ix_event_logs_user_id'), 'event_logs', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Intentionally a no-op: upgrade() skips creation on databases where the
+    # old create_all() already built event_logs, so this revision cannot tell
+    # whether it owns the table. Dropping it here would destroy that data.
+    pass
@@ -0,0 +1,29 @@
+"""Index event_logs.processed_at
+
+Revision ID: 8d41e6b0c2f3
+Revises: 3f9c2d7a1b5e
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41e6b0c2f3'
+down_revision: Union[str, None] = '3f9c2d7a1b5e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Archive exports and prunes select processed_at ranges
+    op.create_index(op.f('ix_event_logs_processed_at'), 'event_logs', ['processed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_event_logs_processed_at'), table_name='event_logs')
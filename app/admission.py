@@ -0,0 +1,116 @@
+"""Admission control for the ingest path: rate limiting and load shedding."""
+import asyncio
+import math
+import time
+import structlog
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets kept in a bounded LRU map.
+
+    Each bucket is a (tokens, last_refill) tuple; once more than max_keys are
+    tracked the least recently seen key is evicted and starts again with a
+    full bucket. Eviction goes by recency, not idleness, so a throttled key
+    can get its burst back early once max_keys other keys have been seen.
+    """
+
+    def __init__(self, rate: float, burst: int, max_keys: int):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.buckets: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def acquire(self, key: str, now: Optional[float] = None) -> float:
+        """Take one token for key; returns 0 if allowed, else seconds to wait."""
+        now = time.monotonic() if now is None else now
+        tokens, last = self.buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+        if tokens >= 1:
+            self.buckets[key] = (tokens - 1, now)
+            wait = 0.0
+        else:
+            self.buckets[key] = (tokens, now)
+            wait = (1 - tokens) / self.rate
+
+        if len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)
+        return wait
+
+    def refund(self, key: str):
+        """Give back a token taken by acquire() for a request that was rejected later."""
+        if key in self.buckets:
+            tokens, last = self.buckets[key]
+            self.buckets[key] = (min(self.burst, tokens + 1), last)
+
+
+@dataclass
+class AdmissionDecision:
+    allowed: bool
+    reason: Optional[str] = None
+    retry_after: int = 0
+
+
+class AdmissionController:
+    def __init__(self, queue_service, worker_lag: Callable[[], float]):
+        self.queue_service = queue_service
+        self.worker_lag = worker_lag
+        self.user_limiter = TokenBucketLimiter(
+            settings.admission_user_rate,
+            settings.admission_user_burst,
+            settings.admission_max_tracked_keys,
+        )
+        self.event_type_limiter = TokenBucketLimiter(
+            settings.admission_event_type_rate,
+            settings.admission_event_type_burst,
+            settings.admission_max_tracked_keys,
+        )
+        self.queue_depth = 0
+        self.running = False
+
+    async def refresh_queue_depth(self):
+        """Refresh the cached queue depth.
+
+        Failures keep the last known depth so an SQS hiccup does not reject
+        all traffic.
+        """
+        try:
+            self.queue_depth = await self.queue_service.get_queue_depth()
+        except Exception as e:
+            logger.warning("Failed to refresh queue depth", error=str(e))
+
+    async def start_queue_depth_refresher(self):
+        """Keep the queue depth fresh in the background so check() never waits on SQS."""
+        self.running = True
+        while self.running:
+            await self.refresh_queue_depth()
+            await asyncio.sleep(settings.admission_queue_depth_refresh_seconds)
+
+    def stop_queue_depth_refresher(self):
+        """Stop the background queue depth refresh"""
+        self.running = False
+
+    def check(self, user_id: str, event_type: str) -> AdmissionDecision:
+        """Decide whether an event may be enqueued."""
+        shed_retry_after = settings.admission_shed_retry_after_seconds
+        if self.queue_depth >= settings.admission_max_queue_depth:
+            return AdmissionDecision(False, "queue_depth", shed_retry_after)
+        if self.worker_lag() >= settings.admission_max_worker_lag_seconds:
+            return AdmissionDecision(False, "worker_lag", shed_retry_after)
+
+        wait = self.user_limiter.acquire(user_id)
+        if wait:
+            return AdmissionDecision(False, "user_rate_limit", math.ceil(wait))
+        wait = self.event_type_limiter.acquire(event_type)
+        if wait:
+            self.user_limiter.refund(user_id)
+            return AdmissionDecision(False, "event_type_rate_limit", math.ceil(wait))
+
+        return AdmissionDecision(True)
@@ -35,7 +35,34 @@ class Settings(BaseSettings):
     # Worker Configuration
     worker_concurrency: int = 5
     worker_poll_interval: int = 5
-    
+
+    # Export Configuration
+    # Read replica used for archive exports, falls back to database_url
+    export_database_url: Optional[str] = os.getenv("EXPORT_DATABASE_URL")
+    export_output_dir: str = "exports"
+    export_format: str = "parquet"
+    export_compression: str = "zstd"
+    export_chunk_hours: int = 24
+    export_batch_size: int = 5000
+    # Parquet row groups are buffered up to whichever limit is reached first
+    export_row_group_rows: int = 1_000_000
+    export_row_group_bytes: int = 128 * 1024 * 1024
+    # --prune refuses ranges ending less than this many hours ago
+    export_prune_safety_margin_hours: int = 1
+
+    # Admission Control
+    # Token buckets: sustained rate (events/second) and burst size
+    admission_user_rate: float = 20.0
+    admission_user_burst: int = 40
+    admission_event_type_rate: float = 500.0
+    admission_event_type_burst: int = 1000
+    admission_max_tracked_keys: int = 10000
+    # Load shedding thresholds
+    admission_max_queue_depth: int = 10000
+    admission_max_worker_lag_seconds: float = 60.0
+    admission_queue_depth_refresh_seconds: float = 5.0
+    admission_shed_retry_after_seconds: int = 5
+
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
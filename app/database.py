@@ -1,31 +1,48 @@
 """Database connection and session management."""
-import os
+from functools import lru_cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
 
-# Database engine
-engine = create_engine(
-    settings.database_url,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    echo=settings.debug,
-)
+# Base model class
+Base = declarative_base()
 
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@lru_cache()
+def get_engine() -> Engine:
+    """Get the shared database engine, created on first use."""
+    return create_engine(
+        settings.database_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        echo=settings.debug,
+    )
 
-# Base model class
-Base = declarative_base()
+
+@lru_cache()
+def get_session_factory() -> sessionmaker:
+    """Get the shared session factory, bound to the shared engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def __getattr__(name):
+    # Keep `from app.database import engine, SessionLocal` working without
+    # connecting at import time.
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db():
     """Get database session."""
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
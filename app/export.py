@@ -0,0 +1,325 @@
+"""Streaming columnar archive export of event_logs."""
+import argparse
+import json
+import os
+import structlog
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.database import get_engine
+from app.models import EventLog
+
+logger = structlog.get_logger()
+
+CHECKPOINT_FILE = "_checkpoint.json"
+
+ARCHIVE_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("user_id", pa.string()),
+    ("event_type", pa.string()),
+    ("event_metadata", pa.string()),
+    ("original_timestamp", pa.timestamp("us")),
+    ("processed_at", pa.timestamp("us")),
+])
+
+EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC, matching the event_logs columns."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class EventLogExporter:
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        read_engine: Optional[Engine] = None,
+        prune_engine: Optional[Engine] = None,
+        export_format: Optional[str] = None,
+        compression: Optional[str] = None,
+        chunk_hours: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        row_group_rows: Optional[int] = None,
+    ):
+        self.output_dir = output_dir or settings.export_output_dir
+        self.export_format = export_format or settings.export_format
+        self.compression = compression or settings.export_compression
+        self.chunk = timedelta(hours=chunk_hours or settings.export_chunk_hours)
+        self.batch_size = batch_size or settings.export_batch_size
+        self.row_group_rows = row_group_rows or settings.export_row_group_rows
+        if self.export_format not in EXTENSIONS:
+            raise ValueError(f"Unsupported export format: {self.export_format}")
+
+        # Exports run on their own unpooled engine, preferably against a read
+        # replica, so they never take connections from the API/worker pool.
+        self.read_engine = read_engine or create_engine(
+            settings.export_database_url or settings.database_url,
+            poolclass=NullPool,
+        )
+        self.prune_engine = prune_engine
+        self.table = EventLog.__table__
+
+    @property
+    def checkpoint_path(self) -> str:
+        return os.path.join(self.output_dir, CHECKPOINT_FILE)
+
+    def load_checkpoint(self) -> Optional[Dict[str, datetime]]:
+        """Return the requested range and end of the last exported chunk, if any."""
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as f:
+            return {key: datetime.fromisoformat(value) for key, value in json.load(f).items()}
+
+    def save_checkpoint(
+        self,
+        start: datetime,
+        end: datetime,
+        exported_until: datetime,
+        pending_prune: Optional[Tuple[datetime, datetime]] = None,
+    ):
+        """Atomically record progress so an interrupted export can resume.
+
+        pending_prune marks a written chunk whose rows are being pruned; if the
+        prune is interrupted it is finished from the ids in the archive file,
+        never by re-exporting a window that is already partly deleted.
+        """
+        state = {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "exported_until": exported_until.isoformat(),
+        }
+        if pending_prune:
+            state["pending_prune_start"] = pending_prune[0].isoformat()
+            state["pending_prune_end"] = pending_prune[1].isoformat()
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def iter_chunks(self, start: datetime, end: datetime) -> Iterator[Tuple[datetime, datetime]]:
+        """Split [start, end) into processed_at windows of chunk_hours."""
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(chunk_start + self.chunk, end)
+            yield chunk_start, chunk_end
+            chunk_start = chunk_end
+
+    def iter_batches(self, chunk_start: datetime, chunk_end: datetime) -> Iterator[pa.RecordBatch]:
+        """Stream a chunk from a server-side cursor as Arrow record batches."""
+        query = (
+            select(
+                self.table.c.id,
+                self.table.c.user_id,
+                self.table.c.event_type,
+                self.table.c.event_metadata,
+                self.table.c.original_timestamp,
+                self.table.c.processed_at,
+            )
+            .where(self.table.c.processed_at >= chunk_start)
+            .where(self.table.c.processed_at < chunk_end)
+            .order_by(self.table.c.processed_at, self.table.c.id)
+        )
+        with self.read_engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=self.batch_size
+            ).execute(query)
+            for rows in result.partitions():
+                columns = list(zip(*rows))
+                yield pa.RecordBatch.from_arrays(
+                    [
+                        pa.array(columns[0], type=pa.int64()),
+                        pa.array(columns[1], type=pa.string()),
+                        pa.array(columns[2], type=pa.string()),
+                        pa.array(
+                            [json.dumps(m) if m is not None else None for m in columns[3]],
+                            type=pa.string(),
+                        ),
+                        pa.array([_to_naive_utc(ts) for ts in columns[4]], type=pa.timestamp("us")),
+                        pa.array([_to_naive_utc(ts) for ts in columns[5]], type=pa.timestamp("us")),
+                    ],
+                    schema=ARCHIVE_SCHEMA,
+                )
+
+    def chunk_path(self, chunk_start: datetime, chunk_end: datetime) -> str:
+        name = f"event_logs_{chunk_start:%Y%m%dT%H%M%S}_{chunk_end:%Y%m%dT%H%M%S}"
+        return os.path.join(self.output_dir, f"{name}.{EXTENSIONS[self.export_format]}")
+
+    def export_chunk(self, chunk_start: datetime, chunk_end: datetime) -> array:
+        """Write one chunk to disk batch by batch; returns the ids written."""
+        path = self.chunk_path(chunk_start, chunk_end)
+        tmp_path = f"{path}.tmp"
+        writer = None
+        written_ids = array("q")
+        # Cursor batches are small; Parquet gets them regrouped into large row
+        # groups so readers are not left scanning hundreds of tiny ones.
+        pending = []
+        pending_rows = pending_bytes = 0
+        try:
+            for batch in self.iter_batches(chunk_start, chunk_end):
+                if writer is None:
+                    if self.export_format == "parquet":
+                        writer = pq.ParquetWriter(tmp_path, ARCHIVE_SCHEMA, compression=self.compression)
+                    else:
+                        writer = ipc.new_file(
+                            tmp_path,
+                            ARCHIVE_SCHEMA,
+                            options=ipc.IpcWriteOptions(compression=self.compression),
+                        )
+                if self.export_format == "parquet":
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    pending_bytes += batch.nbytes
+                    if pending_rows >= self.row_group_rows or pending_bytes >= settings.export_row_group_bytes:
+                        writer.write_table(pa.Table.from_batches(pending), row_group_size=pending_rows)
+                        pending = []
+                        pending_rows = pending_bytes = 0
+                else:
+                    writer.write(batch)
+                written_ids.extend(batch.column(0).to_pylist())
+            if pending:
+                writer.write_table(pa.Table.from_batches(pending), row_group_size=pending_rows)
+        except Exception:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if writer is not None:
+            writer.close()
+            os.replace(tmp_path, path)
+        return written_ids
+
+    def read_archived_ids(self, chunk_start: datetime, chunk_end: datetime) -> array:
+        """Read back the ids stored in a chunk's archive file."""
+        path = self.chunk_path(chunk_start, chunk_end)
+        if self.export_format == "parquet":
+            table = pq.read_table(path, columns=["id"])
+        else:
+            with ipc.open_file(path) as reader:
+                table = reader.read_all().select(["id"])
+        return array("q", table.column("id").to_pylist())
+
+    def prune_chunk(self, chunk_start: datetime, chunk_end: datetime, archived_ids: array) -> int:
+        """Delete the archived rows of a chunk from the primary.
+
+        Only ids that were written to the archive file are deleted, so rows the
+        read replica had not received yet stay on the primary. Each batch is
+        its own transaction to keep locks and WAL short next to the worker's
+        inserts; after a partial prune a re-export rewrites the remaining rows.
+        """
+        pruned = 0
+        for offset in range(0, len(archived_ids), self.batch_size):
+            with self.prune_engine.begin() as conn:
+                result = conn.execute(
+                    delete(self.table)
+                    .where(self.table.c.id.in_(archived_ids[offset:offset + self.batch_size].tolist()))
+                    .where(self.table.c.processed_at >= chunk_start)
+                    .where(self.table.c.processed_at < chunk_end)
+                )
+                pruned += result.rowcount
+        return pruned
+
+    def export(self, start: datetime, end: datetime, prune: bool = False) -> int:
+        """Export [start, end) chunk by chunk, resuming from the checkpoint."""
+        if prune and self.prune_engine is None:
+            raise ValueError("prune_engine is required to prune archived ranges")
+
+        start, end = _to_naive_utc(start), _to_naive_utc(end)
+        prune_cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            hours=settings.export_prune_safety_margin_hours
+        )
+        if prune and end > prune_cutoff:
+            raise ValueError(
+                f"Refusing to prune ranges ending after {prune_cutoff.isoformat()}; "
+                f"recent rows may still be in flight"
+            )
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        resume_from = start
+        checkpoint = self.load_checkpoint()
+        if checkpoint and (checkpoint["start"], checkpoint["end"]) == (start, end):
+            resume_from = checkpoint["exported_until"]
+            logger.info("Resuming export from checkpoint", checkpoint=resume_from.isoformat())
+        elif checkpoint and (checkpoint["exported_until"] < checkpoint["end"] or "pending_prune_start" in checkpoint):
+            raise ValueError(
+                f"{self.checkpoint_path} holds an unfinished export of "
+                f"[{checkpoint['start'].isoformat()}, {checkpoint['end'].isoformat()}); "
+                f"finish it or use another output directory"
+            )
+
+        if resume_from != start and "pending_prune_start" in checkpoint:
+            if not prune:
+                raise ValueError(f"{self.checkpoint_path} holds an interrupted prune; rerun with prune enabled")
+            chunk_start, chunk_end = checkpoint["pending_prune_start"], checkpoint["pending_prune_end"]
+            pruned = self.prune_chunk(chunk_start, chunk_end, self.read_archived_ids(chunk_start, chunk_end))
+            logger.info("Interrupted prune finished", start=chunk_start.isoformat(), rows=pruned)
+            self.save_checkpoint(start, end, resume_from)
+
+        total = 0
+        for chunk_start, chunk_end in self.iter_chunks(resume_from, end):
+            archived_ids = self.export_chunk(chunk_start, chunk_end)
+            rows = len(archived_ids)
+            if prune and rows:
+                self.save_checkpoint(start, end, chunk_end, pending_prune=(chunk_start, chunk_end))
+                pruned = self.prune_chunk(chunk_start, chunk_end, archived_ids)
+                logger.info("Archived range pruned", start=chunk_start.isoformat(), rows=pruned)
+            self.save_checkpoint(start, end, chunk_end)
+            total += rows
+            logger.info(
+                "Exported chunk",
+                start=chunk_start.isoformat(),
+                end=chunk_end.isoformat(),
+                rows=rows,
+            )
+
+        logger.info("Export finished", rows=total)
+        return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export event_logs to columnar archive files.")
+    parser.add_argument(
+        "--start", required=True, type=datetime.fromisoformat,
+        help="Inclusive processed_at lower bound (ISO 8601)",
+    )
+    parser.add_argument(
+        "--end", required=True, type=datetime.fromisoformat,
+        help="Exclusive processed_at upper bound (ISO 8601)",
+    )
+    parser.add_argument("--output-dir", default=settings.export_output_dir)
+    parser.add_argument("--format", choices=sorted(EXTENSIONS), default=settings.export_format)
+    parser.add_argument("--chunk-hours", type=int, default=settings.export_chunk_hours)
+    parser.add_argument("--batch-size", type=int, default=settings.export_batch_size)
+    parser.add_argument(
+        "--prune", action="store_true",
+        help="Delete archived rows from the primary after export",
+    )
+    args = parser.parse_args(argv)
+
+    prune_engine = get_engine() if args.prune else None
+
+    exporter = EventLogExporter(
+        output_dir=args.output_dir,
+        prune_engine=prune_engine,
+        export_format=args.format,
+        chunk_hours=args.chunk_hours,
+        batch_size=args.batch_size,
+    )
+    exporter.export(args.start, args.end, prune=args.prune)
+
+
+if __name__ == "__main__":
+    main()
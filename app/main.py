@@ -9,9 +9,10 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from contextlib import asynccontextmanager
-from app.database import get_db, Base, engine
+from app.database import get_db
 from app.schemas import EventCreate, EventResponse
-from app.queue_service import QueueService
+from app.queue_service import get_queue_service
+from app.admission import AdmissionController
 from app.worker import EventWorker
 from app.models import EventLog
 from app.config import settings
@@ -44,17 +45,20 @@ worker = EventWorker()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    # Schema is managed by Alembic (`alembic upgrade head`), not at boot
     logger.info("Starting application")
-    Base.metadata.create_all(bind=engine)
     
     # Start worker in background
     asyncio.create_task(worker.start_worker())
+    # Admission control reads a cached queue depth kept fresh here
+    asyncio.create_task(admission.start_queue_depth_refresher())
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
     worker.stop_worker()
+    admission.stop_queue_depth_refresher()
 
 app = FastAPI(
     title=settings.app_name,
@@ -71,13 +75,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-queue_service = QueueService()
+queue_service = get_queue_service()
+admission = AdmissionController(queue_service, lambda: worker.lag_seconds)
 
 @app.post("/events", response_model=EventResponse)
 async def create_event(event: EventCreate, db: Session = Depends(get_db)):
     """
     Create and queue an application usage event
     """
+    decision = admission.check(event.user_id, event.event_type)
+    if not decision.allowed:
+        logger.warning("Event rejected by admission control",
+                       user_id=event.user_id,
+                       event_type=event.event_type,
+                       reason=decision.reason)
+        raise HTTPException(
+            status_code=429,
+            detail=f"Event rejected: {decision.reason}",
+            headers={"Retry-After": str(decision.retry_after)}
+        )
+
     try:
         logger.info("Received event for processing")
         # Validate and enqueue event
@@ -12,4 +12,4 @@ class EventLog(Base):
     event_type = Column(String, nullable=False)
     event_metadata = Column(JSON, nullable=True)
     original_timestamp = Column(DateTime, nullable=False)
-    processed_at = Column(DateTime, nullable=False)
\ No newline at end of file
+    processed_at = Column(DateTime, nullable=False, index=True)
\ No newline at end of file
@@ -1,10 +1,10 @@
 import os
-import boto3
 import json
+import asyncio
 import structlog
+from functools import lru_cache
 from typing import Dict, Any
 from datetime import datetime
-from botocore.config import Config
 from app.config import settings
 
 
@@ -15,45 +15,55 @@ class QueueService:
         self.aws_region = settings.aws_region
         self.queue_name = "events-queue"
         self.queue_url = None
-        self.queue_obj = None
-        boto3_config = Config(
-            signature_version='v3',
-            connect_timeout=5,
-            read_timeout=10,
-            retries={'max_attempts': 3},
-        )
-        self.sqs_resource = boto3.resource(
-            'sqs',
-            region_name=self.aws_region,
-            endpoint_url=settings.elasticmq_endpoint_url,
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key,
-            use_ssl=False, 
-            config=boto3_config
+        self._sqs_client = None
 
+    @property
+    def sqs_client(self):
+        """SQS client, created on first use to keep boto3 off the import path.
+
+        Blocking calls run in worker threads, so this is a low-level client
+        (thread-safe) rather than a boto3 resource (not thread-safe).
+        """
+        if self._sqs_client is None:
+            import boto3
+            from botocore.config import Config
+
+            boto3_config = Config(
+                signature_version='v3',
+                connect_timeout=5,
+                read_timeout=10,
+                retries={'max_attempts': 3},
+            )
+            self._sqs_client = boto3.client(
+                'sqs',
+                region_name=self.aws_region,
+                endpoint_url=settings.elasticmq_endpoint_url,
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                use_ssl=False,
+                config=boto3_config,
             )
+        return self._sqs_client
         
     async def initialize_queue_with_client(self):
-        """Alternative initialization using SQS client."""
-        if self.queue_obj:
+        """Look up the queue URL, creating the queue if it does not exist."""
+        if self.queue_url:
             return
             
-        sqs_client = self.sqs_resource.meta.client
+        sqs_client = self.sqs_client
         
         try:
             # Try to get queue URL
-            response = sqs_client.get_queue_url(QueueName=self.queue_name)
+            response = await asyncio.to_thread(sqs_client.get_queue_url, QueueName=self.queue_name)
             self.queue_url = response['QueueUrl']
-            self.queue_obj = self.sqs_resource.Queue(self.queue_url)
             logger.info(f"Found existing queue: {self.queue_url}")
             
         except sqs_client.exceptions.QueueDoesNotExist:
             logger.warning(f"Queue '{self.queue_name}' does not exist, attempting to create...")
             try:
                 # Create queue
-                response = sqs_client.create_queue(QueueName=self.queue_name)
+                response = await asyncio.to_thread(sqs_client.create_queue, QueueName=self.queue_name)
                 self.queue_url = response['QueueUrl']
-                self.queue_obj = self.sqs_resource.Queue(self.queue_url)
                 logger.info(f"Queue '{self.queue_name}' created with URL: {self.queue_url}")
             except Exception as create_error:
                 logger.error(f"Failed to create queue: {create_error}")
@@ -65,19 +75,7 @@ class QueueService:
 
     async def initialize_queue(self):
         """Initializes and gets the queue URL for the client."""
-        if self.queue_obj:
-            return
-        try:
-            self.queue_obj = self.sqs_resource.get_queue_by_name(QueueName=self.queue_name)
-            self.queue_url = self.queue_obj.url
-        except self.sqs_resource.meta.client.exceptions.QueueDoesNotExist:    
-            logger.warning(f"Queue '{self.queue_name}' does not exist, attempting to create...")
-            self.queue_obj = self.sqs_resource.create_queue(QueueName=self.queue_name)
-            self.queue_url = self.queue_obj.url
-            logger.info(f"Queue '{self.queue_name}' created with URL: {self.queue_url}")
-        except Exception as e:
-            logger.error(f"Failed to initialize queue: {e}")
-            raise
+        await self.initialize_queue_with_client()
 
     async def send_event(self, event_data: Dict[str, Any]) -> str:
         """Send event to SQS queue"""
@@ -88,9 +86,10 @@ class QueueService:
                 "timestamp": event_data["timestamp"].isoformat() if isinstance(event_data["timestamp"], datetime) else event_data["timestamp"]
             })
             logger.info("message body is :", message_body)
-            response = self.queue_obj.send_message(
+            response = await asyncio.to_thread(
+                self.sqs_client.send_message,
                 MessageBody=message_body,
-                QueueUrl=self.queue_obj.url,
+                QueueUrl=self.queue_url,
                 MessageAttributes={
                     'event_type': {
                         'StringValue': event_data['event_type'],
@@ -115,26 +114,33 @@ class QueueService:
         """Receive events from SQS queue"""
         await self.initialize_queue_with_client()
         try:    
-            response_messages = self.queue_obj.receive_messages(
+            # Long polling blocks, keep it off the event loop serving the API
+            response = await asyncio.to_thread(
+                self.sqs_client.receive_message,
+                QueueUrl=self.queue_url,
                 MaxNumberOfMessages=max_messages,
                 WaitTimeSeconds=20,  # Long polling
-                MessageAttributeNames=['All']
+                MessageAttributeNames=['All'],
+                AttributeNames=['SentTimestamp', 'ApproximateReceiveCount']
             )
+            response_messages = response.get('Messages', [])
             logger.info(f"Received {len(response_messages)} messages from queue '{self.queue_name}'")
             received_events = []
             for message in response_messages:
                 try:
-                    event_data = json.loads(message.body)
+                    event_data = json.loads(message['Body'])
                     event_data['MessageAttributes'] = {
-                        k: v.get('StringValue') for k, v in message.message_attributes.items()
-                    } if message.message_attributes else {}
-                    event_data['ReceiptHandle'] = message.receipt_handle
+                        k: v.get('StringValue') for k, v in message.get('MessageAttributes', {}).items()
+                    }
+                    event_data['ReceiptHandle'] = message['ReceiptHandle']
+                    event_data['SentTimestamp'] = message.get('Attributes', {}).get('SentTimestamp')
+                    event_data['ApproximateReceiveCount'] = message.get('Attributes', {}).get('ApproximateReceiveCount')
                     received_events.append(event_data)
 
                 except json.JSONDecodeError as jde:
-                    logger.error(f"Failed to decode message body as JSON: {message.body}", error=str(jde))
+                    logger.error(f"Failed to decode message body as JSON: {message['Body']}", error=str(jde))
                 except KeyError as ke:
-                    logger.error(f"Missing expected key in SQS message: {str(ke)}", message=message.body)
+                    logger.error(f"Missing expected key in SQS message: {str(ke)}", message=message.get('Body'))
 
             logger.info(f"Received {len(received_events)} events from queue.")
             return received_events
@@ -143,19 +149,36 @@ class QueueService:
             logger.error("Failed to receive events from queue", error=str(e))
             raise
     
+    async def get_queue_depth(self) -> int:
+        """Get the approximate number of messages waiting in the queue"""
+        await self.initialize_queue_with_client()
+        try:
+            response = await asyncio.to_thread(
+                self.sqs_client.get_queue_attributes,
+                QueueUrl=self.queue_url,
+                AttributeNames=['ApproximateNumberOfMessages']
+            )
+            return int(response['Attributes']['ApproximateNumberOfMessages'])
+        except Exception as e:
+            logger.error("Failed to get queue depth", error=str(e))
+            raise
+
     async def delete_message(self, receipt_handle: str):
         """Delete processed message from queue"""
         await self.initialize_queue()
         try:
-            self.queue_obj.delete_messages(
-                Entries=[
-                    {
-                        'Id': f"msg-{receipt_handle}", # Unique ID for this specific batch entry
-                        'ReceiptHandle': receipt_handle
-                    }
-                ]
+            await asyncio.to_thread(
+                self.sqs_client.delete_message,
+                QueueUrl=self.queue_url,
+                ReceiptHandle=receipt_handle
             )
             logger.info("Message deleted from queue")
         except Exception as e:
             logger.error("Failed to delete message from queue", error=str(e))
-            raise
\ No newline at end of file
+            raise
+
+
+@lru_cache()
+def get_queue_service() -> QueueService:
+    """Get the queue service shared by the API and the worker."""
+    return QueueService()
\ No newline at end of file
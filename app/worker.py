@@ -1,16 +1,19 @@
 import asyncio
+import time
 import structlog
 from datetime import datetime, timezone
 from app.models import EventLog 
-from app.database import SessionLocal
-from app.queue_service import QueueService
+from app.database import get_session_factory
+from app.queue_service import get_queue_service
 
 logger = structlog.get_logger()
 
 class EventWorker:
     def __init__(self):
-        self.queue_service = QueueService()
+        self.queue_service = get_queue_service()
         self.running = False
+        # Seconds between a message being sent and this worker picking it up
+        self.lag_seconds = 0.0
     
     async def process_event(self, event_data: dict) -> EventLog:
         """Process individual event and save to database"""
@@ -27,7 +30,7 @@ class EventWorker:
             }
             
             # Save to database
-            db = SessionLocal()
+            db = get_session_factory()()
             try:
                 logger.info(f"event data dict is : {event_data}")
                 event_log = EventLog(
@@ -51,6 +54,23 @@ class EventWorker:
             logger.error("Failed to process event", error=str(e), event_data=event_data)
             raise
     
+    def record_lag(self, messages: list):
+        """Set lag from the first deliveries in a polled batch.
+
+        Redelivered messages keep their original SentTimestamp, so a message
+        that keeps failing would report an ever-growing lag; skip those. A
+        batch without first deliveries (including an empty poll) resets the
+        lag, otherwise shedding could keep new events out and never recover.
+        """
+        now = time.time()
+        ages = [
+            now - int(message['SentTimestamp']) / 1000
+            for message in messages
+            if message.get('SentTimestamp')
+            and int(message.get('ApproximateReceiveCount') or 1) == 1
+        ]
+        self.lag_seconds = max(ages, default=0.0)
+    
     async def start_worker(self):
         """Start the worker to process events from queue"""
         self.running = True
@@ -60,6 +80,7 @@ class EventWorker:
             try:
                 logger.info("Polling for messages from queue")
                 messages = await self.queue_service.receive_events()
+                self.record_lag(messages)
                 
                 for message in messages:
                     try:
@@ -0,0 +1,75 @@
+"""Startup-time benchmark: import time of app.main and time to first ready /health.
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--port 8765]
+
+Each run starts a fresh interpreter so module caches do not skew the numbers.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import() -> float:
+    """Seconds spent importing app.main in a fresh interpreter."""
+    code = (
+        "import time; t = time.perf_counter(); import app.main; "
+        "print(time.perf_counter() - t)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_first_health(port: int, timeout: float = 30.0) -> float:
+    """Seconds from spawning uvicorn until /health first answers 200."""
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                pass
+            time.sleep(0.01)
+        raise TimeoutError(f"/health not ready after {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def report(name: str, samples):
+    print(
+        f"{name:<20} median={statistics.median(samples) * 1000:8.1f} ms  "
+        f"min={min(samples) * 1000:8.1f} ms  max={max(samples) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    report("import app.main", [measure_import() for _ in range(args.runs)])
+    report("first ready /health", [measure_first_health(args.port) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
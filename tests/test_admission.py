@@ -0,0 +1,82 @@
+import pytest
+from app.admission import AdmissionController, TokenBucketLimiter
+from app.config import settings
+
+
+class FakeQueueService:
+    def __init__(self, depth=0):
+        self.depth = depth
+        self.calls = 0
+
+    async def get_queue_depth(self):
+        self.calls += 1
+        return self.depth
+
+
+def test_token_bucket_limits_and_refills():
+    limiter = TokenBucketLimiter(rate=1.0, burst=2, max_keys=10)
+
+    assert limiter.acquire("abc123", now=0) == 0
+    assert limiter.acquire("abc123", now=0) == 0
+    assert limiter.acquire("abc123", now=0) == pytest.approx(1.0)
+    assert limiter.acquire("other", now=0) == 0
+    assert limiter.acquire("abc123", now=1.5) == 0
+
+
+def test_token_bucket_evicts_least_recently_used():
+    limiter = TokenBucketLimiter(rate=1.0, burst=1, max_keys=2)
+
+    limiter.acquire("a", now=0)
+    limiter.acquire("b", now=0)
+    limiter.acquire("a", now=0)
+    limiter.acquire("c", now=0)
+    assert list(limiter.buckets) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_admission_sheds_on_queue_depth():
+    queue_service = FakeQueueService(depth=settings.admission_max_queue_depth)
+    admission = AdmissionController(queue_service, lambda: 0.0)
+    assert admission.check("abc123", "page_view").allowed
+
+    # check() only reads the depth cached by the background refresh
+    await admission.refresh_queue_depth()
+    decision = admission.check("abc123", "page_view")
+    assert not decision.allowed
+    assert decision.reason == "queue_depth"
+    assert decision.retry_after == settings.admission_shed_retry_after_seconds
+    assert queue_service.calls == 1
+
+
+def test_admission_sheds_on_worker_lag():
+    admission = AdmissionController(
+        FakeQueueService(), lambda: settings.admission_max_worker_lag_seconds
+    )
+
+    decision = admission.check("abc123", "page_view")
+    assert decision.reason == "worker_lag"
+
+
+def test_admission_rate_limits_user():
+    admission = AdmissionController(FakeQueueService(), lambda: 0.0)
+
+    for _ in range(settings.admission_user_burst):
+        assert admission.check("noisy", "page_view").allowed
+    decision = admission.check("noisy", "page_view")
+    assert decision.reason == "user_rate_limit"
+    assert decision.retry_after >= 1
+    assert admission.check("quiet", "page_view").allowed
+
+
+def test_admission_rate_limits_event_type_and_refunds_user(monkeypatch):
+    monkeypatch.setattr(settings, "admission_event_type_burst", 1)
+    admission = AdmissionController(FakeQueueService(), lambda: 0.0)
+
+    assert admission.check("abc123", "page_view").allowed
+    user_tokens = admission.user_limiter.buckets["abc123"][0]
+
+    decision = admission.check("abc123", "page_view")
+    assert decision.reason == "event_type_rate_limit"
+    assert decision.retry_after >= 1
+    # The rejected request does not cost the user a token
+    assert admission.user_limiter.buckets["abc123"][0] >= user_tokens
@@ -6,6 +6,7 @@ from moto import mock_aws
 import boto3
 from app.main import app
 from app.database import Base, engine
+from app.config import settings
 from datetime import datetime
 import structlog
 
@@ -41,4 +42,18 @@ def test_health_check(client):
 def test_metrics(client):
     response = client.get("/metrics")
     assert response.status_code == 200
-    assert "total_events" in response.json()
\ No newline at end of file
+    assert "total_events" in response.json()
+
+def test_create_event_sheds_load(client, monkeypatch):
+    from app.main import admission
+    monkeypatch.setattr(admission, "queue_depth", settings.admission_max_queue_depth)
+
+    event_data = {
+        "user_id": "abc123",
+        "event_type": "page_view",
+        "timestamp": "2025-05-28T10:00:00Z"
+    }
+
+    response = client.post("/events", json=event_data)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(settings.admission_shed_retry_after_seconds)
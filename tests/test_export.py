@@ -0,0 +1,121 @@
+import pytest
+import pyarrow.parquet as pq
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, delete, func, select
+from app.database import Base, SessionLocal, engine
+from app.export import EventLogExporter
+from app.models import EventLog
+
+START = datetime(2020, 1, 1)
+END = datetime(2020, 1, 3)
+
+
+@pytest.fixture
+def archived_events():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.execute(delete(EventLog).where(EventLog.processed_at < END))
+        for hour in range(0, 48, 6):
+            db.add(EventLog(
+                user_id=f"user-{hour}",
+                event_type="page_view",
+                event_metadata={"hour": hour},
+                original_timestamp=START + timedelta(hours=hour),
+                processed_at=START + timedelta(hours=hour),
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_export_writes_chunks(archived_events, tmp_path):
+    exporter = EventLogExporter(output_dir=str(tmp_path), read_engine=engine, chunk_hours=24, batch_size=3)
+
+    assert exporter.export(START, END) == 8
+    first = pq.read_table(exporter.chunk_path(START, START + timedelta(hours=24)))
+    assert first.num_rows == 4
+    assert first.column("user_id").to_pylist() == ["user-0", "user-6", "user-12", "user-18"]
+    # Cursor batches of 3 rows are regrouped into a single row group
+    assert pq.ParquetFile(exporter.chunk_path(START, START + timedelta(hours=24))).num_row_groups == 1
+    assert exporter.load_checkpoint()["exported_until"] == END
+
+
+def test_export_resumes_and_prunes(archived_events, tmp_path):
+    exporter = EventLogExporter(
+        output_dir=str(tmp_path), read_engine=engine, prune_engine=engine, chunk_hours=24
+    )
+    exporter.save_checkpoint(START, END, START + timedelta(hours=24))
+
+    assert exporter.export(START, END, prune=True) == 4
+    with engine.connect() as conn:
+        remaining = conn.execute(
+            select(func.count(EventLog.id)).where(EventLog.processed_at < END)
+        ).scalar()
+    assert remaining == 4
+
+
+def test_checkpoint_only_resumes_same_range(archived_events, tmp_path):
+    exporter = EventLogExporter(output_dir=str(tmp_path), read_engine=engine, chunk_hours=24)
+
+    assert exporter.export(START + timedelta(hours=24), END) == 4
+    # A finished export of a later range does not skip an earlier one
+    assert exporter.export(START, START + timedelta(hours=24)) == 4
+
+    exporter.save_checkpoint(START, END, START + timedelta(hours=24))
+    with pytest.raises(ValueError):
+        exporter.export(START + timedelta(hours=12), END)
+
+
+def test_prune_keeps_rows_missing_from_replica(archived_events, tmp_path):
+    # A lagging replica that has only received the first day of events
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=replica)
+    with engine.connect() as primary, replica.begin() as conn:
+        rows = primary.execute(
+            select(EventLog.__table__).where(EventLog.processed_at < START + timedelta(hours=24))
+        ).mappings().all()
+        conn.execute(EventLog.__table__.insert(), [dict(row) for row in rows])
+
+    exporter = EventLogExporter(
+        output_dir=str(tmp_path / "out"), read_engine=replica, prune_engine=engine, chunk_hours=48
+    )
+
+    assert exporter.export(START, END, prune=True) == 4
+    with engine.connect() as conn:
+        remaining = conn.execute(
+            select(func.count(EventLog.id)).where(EventLog.processed_at < END)
+        ).scalar()
+    assert remaining == 4
+
+
+def test_prune_refuses_recent_ranges(tmp_path):
+    exporter = EventLogExporter(output_dir=str(tmp_path), read_engine=engine, prune_engine=engine)
+
+    with pytest.raises(ValueError):
+        exporter.export(START, datetime.utcnow(), prune=True)
+
+
+def test_interrupted_prune_is_finished_from_archive(archived_events, tmp_path, monkeypatch):
+    exporter = EventLogExporter(
+        output_dir=str(tmp_path), read_engine=engine, prune_engine=engine, chunk_hours=48, batch_size=3
+    )
+    prune_chunk = exporter.prune_chunk
+
+    def interrupted_prune(chunk_start, chunk_end, archived_ids):
+        prune_chunk(chunk_start, chunk_end, archived_ids[:3])
+        raise RuntimeError("connection lost")
+
+    monkeypatch.setattr(exporter, "prune_chunk", interrupted_prune)
+    with pytest.raises(RuntimeError):
+        exporter.export(START, END, prune=True)
+
+    monkeypatch.setattr(exporter, "prune_chunk", prune_chunk)
+    assert exporter.export(START, END, prune=True) == 0
+    # The archive was not rewritten with only the rows left after the partial prune
+    assert pq.read_table(exporter.chunk_path(START, END)).num_rows == 8
+    with engine.connect() as conn:
+        remaining = conn.execute(
+            select(func.count(EventLog.id)).where(EventLog.processed_at < END)
+        ).scalar()
+    assert remaining == 0
@@ -0,0 +1,26 @@
+import pytest
+from moto import mock_aws
+from app.queue_service import QueueService
+
+
+@pytest.mark.asyncio
+async def test_send_receive_delete_round_trip():
+    event_data = {
+        "user_id": "abc123",
+        "event_type": "page_view",
+        "metadata": {"page": "home"},
+        "timestamp": "2025-05-28T10:00:00Z"
+    }
+
+    with mock_aws():
+        queue_service = QueueService()
+        assert await queue_service.send_event(event_data)
+
+        events = await queue_service.receive_events()
+        assert len(events) == 1
+        assert events[0]["user_id"] == "abc123"
+        assert events[0]["MessageAttributes"] == {"event_type": "page_view", "user_id": "abc123"}
+        assert events[0]["SentTimestamp"]
+
+        await queue_service.delete_message(events[0]["ReceiptHandle"])
+        assert await queue_service.get_queue_depth() == 0
@@ -1,3 +1,4 @@
+import time
 import pytest
 import pytest_asyncio
 from app.worker import EventWorker
@@ -18,3 +19,14 @@ async def test_process_event():
     assert result.user_id == "test123"
     assert result.event_type == "test_event"
     assert result.processed_at is not None
+
+def test_record_lag_ignores_redelivered_messages():
+    worker = EventWorker()
+    sent_ms = int((time.time() - 120) * 1000)
+
+    worker.record_lag([{"SentTimestamp": str(sent_ms), "ApproximateReceiveCount": "1"}])
+    assert worker.lag_seconds >= 120
+
+    # A failing message keeps coming back; the lag must not stay over the threshold
+    worker.record_lag([{"SentTimestamp": str(sent_ms), "ApproximateReceiveCount": "3"}])
+    assert worker.lag_seconds == 0.0